@@ -1,4 +1,15 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import files, pdf
+
 __all__ = ['pdf', 'files']
 
-from . import pdf
-from . import files
+
+def __getattr__(name: str) -> Any:
+    # Import submodules on first access so that loading the package (e.g. for
+    # the CLI's --help) does not pull in reportlab and pypdf
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -46,15 +46,23 @@ def get_unique_filename(directory: Path, base_name: str) -> str:
         'report_2.pdf'  # If both report.pdf and report_1.pdf exist
 
     Implementation Notes:
-        - Uses os.path.exists() for file existence checks
+        - Reads the directory once with os.scandir() and checks candidate
+          names against that in-memory set instead of one stat per candidate
+        - Names are compared case-insensitively, so a candidate that differs
+          only in case from an existing file is treated as taken (on
+          case-insensitive filesystems it would overwrite that file)
         - Splits filename into base and extension using os.path.splitext()
         - Counter starts at 1 and increments until a unique name is found
         - Maintains the original file extension
-        - Thread-safe for file existence checks, but race conditions possible
-          between check and actual file creation
+        - Race conditions possible between the directory snapshot and
+          actual file creation
     """
+    # Snapshot the directory contents once, case-folded
+    with os.scandir(directory) as entries:
+        existing = {entry.name.casefold() for entry in entries}
+
     # First, check if the original filename is available
-    if not os.path.exists(directory / base_name):
+    if base_name.casefold() not in existing:
         return base_name
 
     # Split the filename into base and extension
@@ -63,7 +71,7 @@ def get_unique_filename(directory: Path, base_name: str) -> str:
 
     # Keep incrementing counter until we find a unique filename
     counter = 1
-    while os.path.exists(directory / f"{base}_{counter}{ext}"):
+    while f"{base}_{counter}{ext}".casefold() in existing:
         counter += 1
 
     # Return the unique filename with counter inserted before extension
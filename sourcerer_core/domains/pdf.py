@@ -1,42 +1,107 @@
+import functools
 import io
 import os
 import tempfile
+from bisect import bisect_right
+from itertools import accumulate
 from pathlib import Path
-
-# Type hint for stringWidth function
-from typing import List, Optional
+from typing import BinaryIO, List, Optional, Sequence, Tuple, Union, cast
 
 from pypdf import PdfReader, PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    Destination,
+    DictionaryObject,
+    IndirectObject,
+    NameObject,
+)
 from reportlab.lib.colors import black
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfgen import canvas
+from reportlab.pdfgen.textobject import PDFTextObject
 
 from sourcerer_core.domains import files
 
+# A reader's outline: destinations, each optionally followed by a nested list
+# of its children. Unlike pypdf's OutlineType this is covariant and recursive,
+# so the nested lists can be passed back in.
+Outline = Sequence[Union[Destination, "Outline"]]
+
 
+@functools.lru_cache(maxsize=8192)
 def get_string_width(text: str, font_name: str, font_size: int, encoding: str = "utf8") -> float:
-    """Type-safe wrapper for stringWidth function"""
+    """Type-safe, memoized wrapper for stringWidth function"""
     return pdfmetrics.stringWidth(text, font_name, font_size, encoding)  # type: ignore
 
 
-def create_toc_page(filenames: List[str], page_numbers: List[int]) -> str:
-    """Create a table of contents pages and return the path."""
-    # Create a temporary file
-    temp_file = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
-    temp_path = temp_file.name
-    temp_file.close()
+# Resource name of the font used for the page numbers stamped onto each page
+PAGE_NUMBER_FONT = NameObject("/SourcererHelvetica")
+
+# Letter page size and the bottom-center position of the page number stamp
+PAGE_W, PAGE_H = letter
+PAGE_NUM_X: float = PAGE_W / 2 - 20
+PAGE_NUM_Y: float = 30
+
+# Font used for the filename on each document's title page
+TITLE_FONT = "Helvetica"
+
+# Font and size of the TOC entries. Entry wrapping and leader spacing are
+# measured in this font, so they always agree with what is drawn.
+TOC_FONT = "Helvetica"
+TOC_FONT_SIZE = 12
+
 
-    can = canvas.Canvas(temp_path, pagesize=letter)
-    width, height = letter
+def _toc_width(text: str) -> float:
+    """Width of text in the font used for TOC entries."""
+    return get_string_width(text, TOC_FONT, TOC_FONT_SIZE)
+
+
+@functools.lru_cache(maxsize=4096)
+def _wrap_toc_text(text: str, max_width: float) -> Tuple[str, ...]:
+    """
+    Wrap a TOC entry to fit within max_width.
+
+    Results are cached per process, so laying out an entry that was already
+    wrapped at the same width costs a single dict lookup.
+    """
+    words = text.split()
+    lines: List[str] = []
+
+    # Prefix sums of word widths, each followed by a space: the width of the
+    # line words[start:end] is offsets[end] - offsets[start] - space_width
+    space_width = _toc_width(" ")
+    offsets: List[float] = list(
+        accumulate((_toc_width(word) + space_width for word in words), initial=0.0))
+
+    start = 0
+    while start < len(words):
+        # Binary-search the furthest break that keeps the line within
+        # max_width, always keeping at least one word on the line
+        limit = offsets[start] + max_width + space_width
+        end = max(start + 1, bisect_right(offsets, limit) - 1)
+        lines.append(" ".join(words[start:end]))
+        start = end
+
+    return tuple(lines)
+
+
+def _build_toc(
+    target: Union[str, BinaryIO], filenames: List[str], page_numbers: List[int]
+) -> None:
+    """Draw the table of contents pages onto a canvas saved to target."""
+    can = canvas.Canvas(target, pagesize=letter)
+    width, height = PAGE_W, PAGE_H
 
     # Constants for layout
     title_font_size: int = 24
-    text_font_size: int = 12
     line_height: int = 20  # Standard line height
     margin_left: int = 72  # Left margin
     margin_right: int = 72  # Right margin
     dot_spacing: int = 4  # Space between dots
+    # Extra advance after each leader dot so that dots land dot_spacing apart
+    dot_char_space: float = dot_spacing - _toc_width(".")
     page_number_width: int = 40  # Width reserved for page number
     indent: int = 20  # Indentation for wrapped lines
     max_text_width: float = width - margin_left - margin_right - \
@@ -46,36 +111,10 @@ def create_toc_page(filenames: List[str], page_numbers: List[int]) -> str:
 
     def format_display_name(filename: str) -> str:
         """Format the filename for display in TOC."""
-        # Remove extension
-        name = os.path.splitext(filename)[0]
-        return name
-
-    def wrap_text(text: str, max_width: float) -> List[str]:
-        """Wrap text to fit within max_width."""
-        words = text.split()
-        lines: List[str] = []
-        current_line: List[str] = []
-        current_width: float = 0.0
-
-        for word in words:
-            word_width: float = get_string_width(
-                word, "Helvetica", text_font_size)
-            space_width: float = get_string_width(
-                " ", "Helvetica", text_font_size) if current_line else 0.0
-
-            if current_width + word_width + space_width <= max_width:
-                current_line.append(word)
-                current_width += word_width + space_width
-            else:
-                if current_line:
-                    lines.append(" ".join(current_line))
-                current_line = [word]
-                current_width = word_width
-
-        if current_line:
-            lines.append(" ".join(current_line))
-
-        return lines
+        # Remove extension. Filenames carry no directory part, so a plain
+        # rpartition suffices; leading dots (".hidden") do not start one.
+        name, _, _ = filename.rpartition(".")
+        return name if name.strip(".") else filename
 
     def draw_title(y: float) -> float:
         """Draw the title and return the new y position."""
@@ -86,45 +125,55 @@ def create_toc_page(filenames: List[str], page_numbers: List[int]) -> str:
         can.drawString((width - title_width) / 2, y, title)
         return y - (title_font_size + line_height)
 
+    def begin_entries() -> PDFTextObject:
+        """Begin a text object for one page of entries."""
+        text_object = can.beginText()
+        text_object.setFont(TOC_FONT, TOC_FONT_SIZE)
+        return text_object
+
     def start_new_page() -> float:
-        """Start a new page and return the starting y position."""
+        """Flush the current entries, start a new page and return the starting y position."""
+        nonlocal text
+        can.drawText(text)
         can.showPage()
-        can.setFont("Helvetica", text_font_size)
+        text = begin_entries()
         return height - top_margin
 
+    # Lay out every entry before drawing: wrapped lines, leader dots and the
+    # page number position, so the drawing loop below does no measuring
+    entries: List[Tuple[Tuple[str, ...], float, int, str, float]] = []
+    for filename, page_num in zip(filenames, page_numbers):
+        lines = _wrap_toc_text(format_display_name(filename), max_text_width)
+        text_width: float = _toc_width(lines[0])
+        dots_width: float = width - margin_left - \
+            margin_right - text_width - page_number_width
+        num_dots = int(dots_width / dot_spacing)
+        page_num_str = str(page_num)
+        page_num_x: float = width - margin_right - _toc_width(page_num_str)
+        entries.append((lines, text_width, num_dots, page_num_str, page_num_x))
+
     # Start drawing TOC
     y = height - top_margin
     y = draw_title(y) - line_height  # Account for title and extra spacing
 
-    # Draw entries
-    can.setFont("Helvetica", text_font_size)
-    for filename, page_num in zip(filenames, page_numbers):
-        display_text = format_display_name(filename)
-        lines = wrap_text(display_text, max_text_width)
-
+    # Draw entries. Each page's entries go into a single text object, so the
+    # page gets one BT/ET block instead of one per string.
+    text = begin_entries()
+    for lines, text_width, num_dots, page_num_str, page_num_x in entries:
         # Check if we need a new page
         if y - (len(lines) * line_height) < bottom_margin:
             y = start_new_page()
 
         # Draw first line with dots and page number
-        first_line = lines[0]
-        text_width: float = get_string_width(
-            first_line, "Helvetica", text_font_size)
-        can.drawString(margin_left, y, first_line)
-
-        # Draw dots
-        dots_width: float = width - margin_left - \
-            margin_right - text_width - page_number_width
-        num_dots = int(dots_width / dot_spacing)
-        for i in range(num_dots):
-            can.drawString(margin_left + text_width +
-                           (i * dot_spacing), y, ".")
-
-        # Draw page number
-        page_num_str = str(page_num)
-        page_num_width: float = get_string_width(
-            page_num_str, "Helvetica", text_font_size)
-        can.drawString(width - margin_right - page_num_width, y, page_num_str)
+        text.setTextOrigin(margin_left, y)
+        text.textOut(lines[0])
+        # Draw the whole leader as one string
+        text.setTextOrigin(margin_left + text_width, y)
+        text.setCharSpace(dot_char_space)
+        text.textOut("." * num_dots)
+        text.setCharSpace(0)
+        text.setTextOrigin(page_num_x, y)
+        text.textOut(page_num_str)
 
         y -= line_height
 
@@ -133,43 +182,72 @@ def create_toc_page(filenames: List[str], page_numbers: List[int]) -> str:
             # Check if we need a new page
             if y < bottom_margin:
                 y = start_new_page()
-            can.drawString(margin_left + indent, y, line)
+            text.setTextOrigin(margin_left + indent, y)
+            text.textOut(line)
             y -= line_height
 
+    can.drawText(text)
     can.save()
-    return temp_path
 
 
-def create_title_page(filename: str) -> str:
-    """Create a PDF page with the filename as its content."""
-    # Create a temporary file
-    temp_file = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
-    temp_path = temp_file.name
-    temp_file.close()
+def create_toc_buffer(filenames: List[str], page_numbers: List[int]) -> io.BytesIO:
+    """Render the table of contents pages into a buffer positioned at its start."""
+    buffer = io.BytesIO()
+    _build_toc(buffer, filenames, page_numbers)
+    buffer.seek(0)
+    return buffer
+
+
+def create_toc_page(
+    filenames: List[str],
+    page_numbers: List[int],
+    out_path: Optional[Union[str, Path]] = None,
+) -> str:
+    """Create a table of contents pages at out_path or a temp file and return the path."""
+    if out_path is None:
+        # Create a temporary file
+        temp_file = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
+        out_path = temp_file.name
+        temp_file.close()
+
+    _build_toc(str(out_path), filenames, page_numbers)
+    return str(out_path)
 
-    # Create the PDF
-    c = canvas.Canvas(temp_path, pagesize=letter)
-    width, height = letter
+
+def layout_title_text(filename: str) -> Tuple[int, float, float]:
+    """Return the font size and x/y position of a title page's filename."""
+    width, height = PAGE_W, PAGE_H
 
     # Set margins to 10% of page width
     margin = width * 0.1
     max_width = width - (2 * margin)
 
-    # Start with a large font size and reduce if necessary
-    font_name = "Helvetica"
-    font_size = 24
-    c.setFont(font_name, font_size)
-    text_width: float = get_string_width(filename, font_name, font_size)
-
-    # Reduce font size until text fits within margins
-    while text_width > max_width and font_size > 12:
-        font_size -= 1
-        c.setFont(font_name, font_size)
-        text_width = get_string_width(filename, font_name, font_size)
+    # Start with a large font size and reduce if necessary. String width is
+    # linear in font size, so the largest size that fits within the margins
+    # follows directly from a single measurement at the starting size.
+    max_font_size = 24
+    min_font_size = 12
+    full_width: float = get_string_width(filename, TITLE_FONT, max_font_size)
+    if full_width <= max_width:
+        font_size = max_font_size
+    else:
+        font_size = max(min_font_size,
+                        int(max_font_size * max_width / full_width))
+    text_width: float = full_width * font_size / max_font_size
 
     # Center the text
     x: float = (width - text_width) / 2
     y: float = (height + font_size) / 2
+    return font_size, x, y
+
+
+def _build_title_page(target: Union[str, BinaryIO], filename: str) -> None:
+    """Draw a title page for filename onto a canvas saved to target."""
+    font_size, x, y = layout_title_text(filename)
+
+    # Create the PDF
+    c = canvas.Canvas(target, pagesize=letter)
+    c.setFont(TITLE_FONT, font_size)
 
     # Draw the text
     c.setFillColor(black)
@@ -177,47 +255,110 @@ def create_title_page(filename: str) -> str:
     c.showPage()
     c.save()
 
-    return temp_path
 
+def create_title_buffer(filename: str) -> io.BytesIO:
+    """Render a title page for filename into a buffer positioned at its start."""
+    buffer = io.BytesIO()
+    _build_title_page(buffer, filename)
+    buffer.seek(0)
+    return buffer
 
-def add_page_numbers(input_path: str, output_path: str, total_pages: int) -> None:
-    """Add page numbers to the bottom of each page."""
-    reader = PdfReader(input_path)
-    writer = PdfWriter()
 
-    # Add pages with page numbers
-    for page_num in range(len(reader.pages)):
-        page = reader.pages[page_num]
+def create_title_page(filename: str) -> str:
+    """Create a PDF page with the filename as its content."""
+    # Create a temporary file
+    temp_file = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
+    temp_path = temp_file.name
+    temp_file.close()
+
+    _build_title_page(temp_path, filename)
+    return temp_path
+
 
-        # Create a canvas for the page number
-        packet = io.BytesIO()
-        can = canvas.Canvas(packet, pagesize=letter)
+def _content_stream(data: bytes) -> DecodedStreamObject:
+    """Wrap raw content-stream operators in a stream object."""
+    stream = DecodedStreamObject()
+    stream.set_data(data)
+    return stream
+
+
+def add_page_numbers(writer: PdfWriter) -> None:
+    """Stamp "Page X of Y" onto every page of the writer in place."""
+    total_pages = len(writer.pages)
+
+    # Unlike merge_page, which decodes every page's content and writes it
+    # back uncompressed, each page keeps its original content streams. They
+    # are wrapped in q/Q so they cannot affect the stamp, which is a few
+    # bytes of text operators appended after them. The stamp's Helvetica
+    # font and the opening q stream are shared by every page.
+    font = DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+        NameObject("/Encoding"): NameObject("/WinAnsiEncoding"),
+    })
+    save_state = _content_stream(b"q\n")
+
+    # Only the page number changes between stamps
+    stamp_start = (f"\nQ\nq BT {PAGE_NUMBER_FONT} 12 Tf {PAGE_NUM_X} {PAGE_NUM_Y} Td "
+                   "(Page ")
+    stamp_end = f" of {total_pages}) Tj ET Q\n"
+
+    for page_num, page in enumerate(writer.pages, start=1):
+        # Every page registers the same font under the same name, so shared
+        # resource dictionaries can be updated in place
+        if "/Resources" not in page:
+            page[NameObject("/Resources")] = DictionaryObject()
+        resources = cast(DictionaryObject, page["/Resources"])
+        if "/Font" not in resources:
+            resources[NameObject("/Font")] = DictionaryObject()
+        cast(DictionaryObject, resources["/Font"])[PAGE_NUMBER_FONT] = font
 
         # Add page number at the bottom center
-        can.drawString(letter[0]/2 - 20, 30,
-                       f"Page {page_num + 1} of {total_pages}")
-        can.save()
-
-        # Move to the beginning of the StringIO buffer
-        packet.seek(0)
-        new_pdf = PdfReader(packet)
-
-        # Merge the page number with the existing page
-        page.merge_page(new_pdf.pages[0])
-        writer.add_page(page)
-
-    # Copy bookmarks
-    for bookmark in reader.outline:
-        if isinstance(bookmark, dict):
-            # This is a bookmark dictionary
-            writer.add_outline_item(
-                bookmark.get('/Title', ''),
-                bookmark.get('/Page', 0)
-            )
+        stamp = f"{stamp_start}{page_num}{stamp_end}"
+
+        contents = ArrayObject([save_state])
+        if "/Contents" in page:
+            original = page.raw_get("/Contents")
+            resolved = original.get_object()
+            if isinstance(resolved, ArrayObject):
+                contents.extend(resolved)
+            else:
+                contents.append(original)
+            # Detach the old entry so replace_contents doesn't discard the
+            # streams that are being reused
+            del page["/Contents"]
+        contents.append(_content_stream(stamp.encode()))
+        # replace_contents registers each new stream with the writer; the
+        # shared q stream is only added once
+        page.replace_contents(contents)
+
+
+def copy_outline(
+    writer: PdfWriter,
+    reader: PdfReader,
+    outline: Outline,
+    parent: IndirectObject,
+    page_offset: int,
+) -> None:
+    """
+    Recreate a reader's outline, including nested items, under parent.
 
-    # Write the result to a temporary file
-    with open(output_path, 'wb') as output_file:
-        writer.write(output_file)
+    Page targets are shifted by page_offset, the writer index of the reader's
+    first page. Items without a resolvable page point at that first page.
+    """
+    last_item = parent
+    for item in outline:
+        if not isinstance(item, Destination):
+            # A nested list holds the children of the preceding item
+            copy_outline(writer, reader, item, last_item, page_offset)
+        else:
+            page_number = reader.get_destination_page_number(item)
+            last_item = writer.add_outline_item(
+                item.title or "",
+                page_offset + (page_number or 0),
+                parent=parent,
+            )
 
 
 def merge(input_dir: Path, output_name: str = "merged_pdfs.pdf") -> Optional[Path]:
@@ -229,74 +370,61 @@ def merge(input_dir: Path, output_name: str = "merged_pdfs.pdf") -> Optional[Pat
     if not output_name.lower().endswith('.pdf'):
         output_name = f"{output_name}.pdf"
 
-    # Get list of PDF files
-    pdf_files: List[Path] = sorted([f for f in input_dir.glob(
-        "*.pdf") if f.name != output_name and not f.name.startswith('merged_pdfs')])
+    # Get list of PDF files from a single directory scan. Names are compared
+    # case-insensitively, so REPORT.PDF is merged while a previous output such
+    # as MERGED_PDFS.PDF is still skipped.
+    output_key = output_name.casefold()
+    with os.scandir(input_dir) as entries:
+        pdf_files: List[Path] = sorted(
+            (Path(entry.path) for entry in entries
+             if (name := entry.name.casefold()).endswith('.pdf')
+             and entry.is_file()
+             and name != output_key
+             and not name.startswith('merged_pdfs')),
+            key=lambda f: f.name)
 
     if not pdf_files:
         print("No PDF files found to merge")
         return None
 
-    # Get page counts for each PDF
-    page_counts: List[int] = []
-    for pdf_file in pdf_files:
-        with open(pdf_file, 'rb') as file:
-            pdf = PdfReader(file)
-            page_counts.append(len(pdf.pages))
+    filenames: List[str] = [f.name for f in pdf_files]
+
+    # Open each PDF once; the cached readers provide both the page counts
+    # and the pages copied into the merged document
+    readers: List[PdfReader] = [PdfReader(pdf_file) for pdf_file in pdf_files]
+    page_counts: List[int] = [len(reader.pages) for reader in readers]
     print(f"PDF page counts: {page_counts}")
 
     # Calculate actual page numbers for TOC
-    page_numbers: List[int] = []
-
-    # First document starts at page 4 (after TOC)
-    current_page: int = 4
-    page_numbers.append(current_page)
-
-    # Calculate remaining page numbers
-    for i in range(1, len(pdf_files)):
-        # Add previous document's pages + 1 for title page
-        current_page += page_counts[i-1] + 1
-        page_numbers.append(current_page)
+    # First document starts at page 4 (after TOC); each following document
+    # starts after the previous document's pages + 1 for its title page
+    page_numbers: List[int] = list(
+        accumulate((count + 1 for count in page_counts[:-1]), initial=4))
 
     print(f"Final page numbers: {page_numbers}")
 
-    # Create TOC with correct page numbers
-    toc_path: str = create_toc_page([f.name for f in pdf_files], page_numbers)
-
     # Create writer object
     writer = PdfWriter()
 
-    # Add TOC to the beginning
-    with open(toc_path, 'rb') as file:
-        toc_reader = PdfReader(file)
-        for page in toc_reader.pages:
-            writer.add_page(page)
+    # Add TOC to the beginning. The TOC and title pages are rendered into
+    # in-memory buffers, so no temporary files are involved. Rendered pages
+    # and documents are copied with append, which clones each source's shared
+    # resources once.
+    writer.append(create_toc_buffer(filenames, page_numbers), import_outline=False)
 
     # Add all PDF files with their title pages
-    current_page = len(writer.pages)  # Start after TOC pages
-
-    for i, pdf_file in enumerate(pdf_files):
-        # Add title page
-        title_path: str = create_title_page(pdf_file.name)
-        with open(title_path, 'rb') as file:
-            title_reader = PdfReader(file)
-            for page in title_reader.pages:
-                writer.add_page(page)
-                current_page += 1
-
-            # Add bookmark for the document
-            # -1 because current_page is next page
-            writer.add_outline_item(pdf_file.name, current_page - 1)
-
-        # Add actual PDF content
-        with open(pdf_file, 'rb') as file:
-            pdf_reader = PdfReader(file)
-            for page in pdf_reader.pages:
-                writer.add_page(page)
-                current_page += 1
-
-        # Clean up title page
-        os.unlink(title_path)
+    for pdf_file, pdf_reader in zip(pdf_files, readers):
+        # Add title page and a bookmark pointing at it
+        title_index = len(writer.pages)
+        writer.append(create_title_buffer(pdf_file.name), import_outline=False)
+        bookmark = writer.add_outline_item(pdf_file.name, title_index)
+
+        # Add actual PDF content from the cached reader, nesting the
+        # document's own outline under its bookmark
+        content_index = len(writer.pages)
+        writer.append(pdf_reader, import_outline=False)
+        copy_outline(writer, pdf_reader, pdf_reader.outline, bookmark,
+                     content_index)
 
     # Create output directory if it doesn't exist
     output_path = input_dir / output_name
@@ -304,23 +432,13 @@ def merge(input_dir: Path, output_name: str = "merged_pdfs.pdf") -> Optional[Pat
         output_name = files.get_unique_filename(input_dir, output_name)
         output_path = input_dir / output_name
 
-    # Write merged PDF to a temporary file first
-    temp_output = str(output_path) + ".temp"
+    # The writer already holds every page, so stamp the page numbers in
+    # memory and write the merged PDF exactly once
+    add_page_numbers(writer)
+
     print(f"Writing merged PDF to: {output_path}")
-    with open(temp_output, 'wb') as output_file:
+    with open(output_path, 'wb') as output_file:
         writer.write(output_file)
 
-    # Calculate total pages
-    with open(temp_output, 'rb') as file:
-        pdf = PdfReader(file)
-        total_pages = len(pdf.pages)
-
-    # Add page numbers
-    add_page_numbers(temp_output, str(output_path), total_pages)
-
-    # Clean up
-    os.unlink(toc_path)
-    os.unlink(temp_output)
-
     print("PDF merge complete!")
     return output_path
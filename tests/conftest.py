@@ -0,0 +1,120 @@
+"""
+Shared fixtures for the Source Works test suite.
+
+The sample PDF used throughout the tests never changes, so it is generated
+once per session in a temporary directory and shared by all tests.
+
+Fixtures:
+- sample_pdf: A basic single-page PDF
+- sample_pdf_bytes: The contents of sample_pdf, read once
+- pdf_bytes_factory: Renders in-memory PDFs with a given page count
+- _warm_reportlab: Primes reportlab once at session start (autouse)
+
+Implementation Notes:
+- The file lives under pytest's session temporary directory, so each xdist
+  worker generates its own copy
+- Tests must treat the file as read-only and copy it before modifying
+"""
+
+import functools
+import io
+from pathlib import Path
+from typing import Callable, List
+
+import pytest
+from reportlab.pdfgen import canvas
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_reportlab() -> None:
+    """
+    Render a throwaway PDF once before any test runs.
+
+    reportlab loads its font metrics and sets up its PDF machinery on first
+    use. Doing that here keeps the one-off cost out of whichever test happens
+    to draw first.
+    """
+    c = canvas.Canvas(io.BytesIO())
+    c.setFont("Helvetica", 12)
+    c.drawString(0, 0, "")
+    c.save()
+
+
+def _write_pdf(path: Path, pages: List[str]) -> str:
+    """
+    Write a PDF with one page per entry in pages.
+
+    Args:
+        path (Path): Where to write the PDF.
+        pages (List[str]): Text drawn on each page of the PDF.
+
+    Returns:
+        str: Path to the PDF file.
+    """
+    c = canvas.Canvas(str(path))
+    for text in pages:
+        c.drawString(100, 750, text)
+        c.showPage()
+    c.save()
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def _pdf_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide the session directory holding the shared sample PDF."""
+    return tmp_path_factory.mktemp("pdfs")
+
+
+@pytest.fixture(scope="session")
+def sample_pdf(_pdf_dir: Path) -> str:
+    """
+    Provide a sample PDF file for testing.
+
+    This fixture provides a simple single-page PDF with basic content.
+    The file is shared by all tests and must not be modified.
+
+    Returns:
+        str: Path to the PDF file.
+    """
+    return _write_pdf(_pdf_dir / "sample.pdf", ["Test Content"])
+
+
+@pytest.fixture(scope="session")
+def sample_pdf_bytes(sample_pdf: str) -> bytes:
+    """
+    Provide the contents of the sample PDF.
+
+    Lets tests write independent copies of the sample with a single
+    write_bytes call, without reopening and reading the source each time.
+
+    Returns:
+        bytes: The sample PDF file contents.
+    """
+    return Path(sample_pdf).read_bytes()
+
+
+@pytest.fixture(scope="session")
+def pdf_bytes_factory() -> Callable[[int], bytes]:
+    """
+    Create a function that renders a PDF with a given number of pages.
+
+    Each distinct page count is rendered once per session, in memory, and
+    later calls return the same bytes.
+
+    Returns:
+        Callable[[int], bytes]: Function that takes a page count and returns
+        the PDF file contents.
+
+    Content:
+        - Page N: "Content page N"
+    """
+    @functools.lru_cache(maxsize=None)
+    def make(page_count: int) -> bytes:
+        buffer = io.BytesIO()
+        c = canvas.Canvas(buffer)
+        for i in range(page_count):
+            c.drawString(100, 750, f"Content page {i+1}")
+            c.showPage()
+        c.save()
+        return buffer.getvalue()
+    return make